@@ -0,0 +1,78 @@
+"""Unit tests for tabular value extraction from EnergyPlus SQL output."""
+
+import sqlite3
+
+import pytest
+
+from tests.utils.sql_utils import extract_from_tabular_data
+
+# Text values that do not parse as a float, though CAST reads a numeric prefix
+NON_NUMERIC_VALUES = ["2020-01", "7-15", "1.2.3", "5+", "12:00"]
+
+
+def _old_schema_cursor(values):
+    """Build an older-schema TabularData table with one EnergyMeters row per value."""
+    conn = sqlite3.connect(":memory:")
+    # No declared type on Value, so numbers keep their REAL/INTEGER storage class
+    conn.execute(
+        "CREATE TABLE TabularData"
+        "(ReportName TEXT, TableName TEXT, RowName TEXT, ColumnName TEXT, Value, Units TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO TabularData VALUES ('EnergyMeters', 'Annual', ?, 'Total', ?, 'GJ')",
+        [(f"row{i}", value) for i, value in enumerate(values)],
+    )
+    return conn.cursor()
+
+
+def _new_schema_cursor(values):
+    """Build an index-based TabularData table with one EnergyMeters row per value."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE Strings (StringIndex INTEGER PRIMARY KEY, Value TEXT)")
+    conn.execute(
+        "CREATE TABLE TabularData (TabularDataIndex INTEGER PRIMARY KEY, "
+        "ReportNameIndex INTEGER, TableNameIndex INTEGER, RowNameIndex INTEGER, "
+        "ColumnNameIndex INTEGER, UnitsIndex INTEGER, RowId INTEGER, Value TEXT)"
+    )
+    names = ["EnergyMeters", "Annual", "Total", "GJ"] + [f"row{i}" for i in range(len(values))]
+    conn.executemany("INSERT INTO Strings VALUES (?, ?)", list(enumerate(names)))
+    conn.executemany(
+        "INSERT INTO TabularData (ReportNameIndex, TableNameIndex, RowNameIndex, "
+        "ColumnNameIndex, UnitsIndex, RowId, Value) VALUES (0, 1, ?, 2, 3, ?, ?)",
+        [(4 + i, i, value) for i, value in enumerate(values)],
+    )
+    return conn.cursor()
+
+
+def _extracted_values(cursor):
+    """Map row name to the extracted value for the single test table."""
+    data = extract_from_tabular_data(cursor)
+    rows = data.get("EnergyMeters", {}).get("Annual", {})
+    return {row: columns["Total"]["value"] for row, columns in rows.items()}
+
+
+@pytest.mark.parametrize("make_cursor", [_old_schema_cursor, _new_schema_cursor])
+class TestTabularValueParsing:
+    """Tabular values must be accepted or skipped exactly as float() decides."""
+
+    def test_non_numeric_text_is_skipped(self, make_cursor):
+        """Dates, ranges and malformed numbers are not read as their numeric prefix."""
+        values = _extracted_values(make_cursor(NON_NUMERIC_VALUES + ["42.5"]))
+        assert values == {f"row{len(NON_NUMERIC_VALUES)}": 42.5}
+
+    def test_surrounding_whitespace_is_accepted(self, make_cursor):
+        """Whitespace that str.strip() removes, including tabs, does not reject a value."""
+        values = _extracted_values(make_cursor(["4\t", " 2.5 ", "1e3\n"]))
+        assert values == {"row0": 4.0, "row1": 2.5, "row2": 1000.0}
+
+    def test_non_positive_and_empty_values_are_filtered(self, make_cursor):
+        """Zero, negative, empty and NULL values are excluded from the results."""
+        values = _extracted_values(make_cursor(["0", "-3", "", None, "7"]))
+        assert values == {"row4": 7.0}
+
+
+def test_numeric_storage_keeps_full_precision():
+    """REAL and INTEGER values are returned as exact floats, not via text."""
+    values = _extracted_values(_old_schema_cursor([0.30000000000000004, 123456.78901234567, 7]))
+    assert values == {"row0": 0.30000000000000004, "row1": 123456.78901234567, "row2": 7.0}
+    assert all(type(value) is float for value in values.values())
@@ -8,19 +8,79 @@ This module provides common functions for:
 - Path resolution and validation
 """
 
+import contextlib
+import functools
 import json
+import math
 import os
 import shutil
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Golden file directory structure
 GOLDEN_FILES_BASE = "tests/fixtures/expected_outputs/golden_files"
 BASELINE_DIR = os.path.join(GOLDEN_FILES_BASE, "baseline")
 COMPARISON_DIR = os.path.join(GOLDEN_FILES_BASE, "comparison")
 BACKUP_BASE_DIR = os.path.join(GOLDEN_FILES_BASE, "backup")
 
+# Directories already created (or found to exist) by _ensure_dir
+_ensured_dirs: set[str] = set()
+
+# Parsed JSON keyed by absolute path -> ((mtime_ns, size), data)
+_json_cache: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def _mtime_memoize(
+    func: Callable[[str], dict[str, Any] | None],
+) -> Callable[[str], dict[str, Any] | None]:
+    """
+    Memoize a JSON loader on the file's path, modification time and size.
+
+    A cached result is only returned while the file's stat signature is
+    unchanged; failed loads (None) are never cached. Cached dicts are shared
+    between callers, so they must be treated as read-only.
+    """
+
+    @functools.wraps(func)
+    def wrapper(file_path: str) -> dict[str, Any] | None:
+        abs_path = os.path.abspath(file_path)
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            _json_cache.pop(abs_path, None)
+            return func(file_path)
+
+        stat_key = (st.st_mtime_ns, st.st_size)
+        cached = _json_cache.get(abs_path)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+
+        data = func(file_path)
+        if data is None:
+            _json_cache.pop(abs_path, None)
+        else:
+            _json_cache[abs_path] = (stat_key, data)
+        return data
+
+    return wrapper
+
+
+def _clear_json_cache(file_path: str | None = None) -> None:
+    """Drop the cached JSON for file_path, or the whole cache if no path is given."""
+    if file_path is None:
+        _json_cache.clear()
+    else:
+        _json_cache.pop(os.path.abspath(file_path), None)
+
 
 def get_baseline_summary_path() -> str:
     """Get path to baseline energy summary file."""
@@ -62,22 +122,34 @@ def get_comparison_hpxml_path(base_name: str) -> str:
     return os.path.join(COMPARISON_DIR, f"comparison_{base_name}.xml")
 
 
+def _ensure_dir(directory: str) -> None:
+    """Create directory if needed, skipping directories already ensured by this process."""
+    if directory in _ensured_dirs:
+        return
+    os.makedirs(directory, exist_ok=True)
+    _ensured_dirs.add(directory)
+
+
 def ensure_golden_directories() -> None:
     """Ensure all golden file directories exist."""
     for directory in [BASELINE_DIR, COMPARISON_DIR]:
-        os.makedirs(directory, exist_ok=True)
+        _ensure_dir(directory)
 
 
 def create_backup_directory() -> str:
     """
     Create a timestamped backup directory.
 
+    The name includes microseconds and the process id, so concurrent runs (e.g.
+    parallel pytest workers) never share a directory; creation fails loudly
+    rather than reusing one if a collision still occurs.
+
     Returns:
         Path to the created backup directory
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_dir = os.path.join(BACKUP_BASE_DIR, f"backup_{timestamp}")
-    os.makedirs(backup_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    backup_dir = os.path.join(BACKUP_BASE_DIR, f"backup_{timestamp}_{os.getpid()}")
+    os.makedirs(backup_dir, exist_ok=False)
     return backup_dir
 
 
@@ -88,12 +160,18 @@ def backup_golden_files() -> str | None:
     Returns:
         Path to backup directory if backup was created, None if no files to backup
     """
-    if not os.path.exists(BASELINE_DIR):
+    # Check if there are any files to backup
+    try:
+        with os.scandir(BASELINE_DIR) as entries:
+            baseline_files = [
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
         print("No baseline directory found, no backup needed")
         return None
 
-    # Check if there are any files to backup
-    baseline_files = [f for f in os.listdir(BASELINE_DIR) if f.endswith(".json")]
     if not baseline_files:
         print("No baseline files found, no backup needed")
         return None
@@ -101,25 +179,36 @@ def backup_golden_files() -> str | None:
     # Create backup directory
     backup_dir = create_backup_directory()
 
-    # Copy all baseline files to backup
-    files_backed_up = 0
-    for file_name in baseline_files:
+    def backup_file(file_name: str) -> bool:
+        # Real copies, not hardlinks: save_json_file swaps in a new file, but
+        # generate_baseline_data.py still truncates and rewrites baseline files in
+        # place, which would change a hardlinked backup too. copyfile uses the
+        # platform's in-kernel copy where available; file metadata is not needed.
         src_path = os.path.join(BASELINE_DIR, file_name)
         dst_path = os.path.join(backup_dir, file_name)
         try:
-            shutil.copy2(src_path, dst_path)
-            files_backed_up += 1
+            shutil.copyfile(src_path, dst_path)
+            return True
         except Exception as e:
             print(f"Warning: Failed to backup {file_name}: {e}")
+            return False
+
+    # Copy all baseline files to backup; the copies are I/O bound, so threads overlap them
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        files_backed_up = sum(executor.map(backup_file, baseline_files))
 
     print(f"✅ Backed up {files_backed_up} baseline files to: {backup_dir}")
     return backup_dir
 
 
+@_mtime_memoize
 def load_json_file(file_path: str) -> dict[str, Any] | None:
     """
     Load JSON data from file with error handling.
 
+    Parsed results are cached until the file changes on disk; callers must not
+    mutate the returned dict.
+
     Args:
         file_path: Path to JSON file
 
@@ -127,12 +216,21 @@ def load_json_file(file_path: str) -> dict[str, Any] | None:
         Loaded JSON data or None if error
     """
     try:
+        if orjson is not None:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson rejects the NaN/Infinity tokens the stdlib writes
+                return json.loads(raw)
         with open(file_path) as f:
             return json.load(f)
     except FileNotFoundError:
         print(f"File not found: {file_path}")
         return None
     except json.JSONDecodeError as e:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
         print(f"JSON decode error in {file_path}: {e}")
         return None
     except Exception as e:
@@ -140,6 +238,52 @@ def load_json_file(file_path: str) -> dict[str, Any] | None:
         return None
 
 
+def _has_non_finite(data: Any) -> bool:
+    """Return True if data contains a NaN or infinite float at any depth."""
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list | tuple):
+            stack.extend(item)
+    return False
+
+
+def _write_json(data: dict[str, Any], file_path: str, indent: int) -> None:
+    """
+    Serialize data and atomically replace file_path with it.
+
+    The payload is built in memory, written to a temporary file in one call and
+    moved into place with os.replace, so readers never see a partially written
+    file. orjson is used for the default indent when available, except for
+    payloads holding NaN or Infinity, which orjson would silently write as null,
+    and values it cannot encode, which the stdlib json module handles.
+    """
+    payload = None
+    if orjson is not None and indent == 2 and not _has_non_finite(data):
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. numpy scalars or integers beyond 64 bits
+            payload = None
+    if payload is None:
+        payload = json.dumps(data, indent=indent).encode("utf-8")
+
+    tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
 def save_json_file(data: dict[str, Any], file_path: str, indent: int = 2) -> bool:
     """
     Save JSON data to file with error handling.
@@ -154,10 +298,17 @@ def save_json_file(data: dict[str, Any], file_path: str, indent: int = 2) -> boo
     """
     try:
         # Ensure directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        directory = os.path.dirname(file_path)
+        _ensure_dir(directory)
 
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=indent)
+        try:
+            _write_json(data, file_path, indent)
+        except FileNotFoundError:
+            # The directory was removed after it was ensured; create it again
+            _ensured_dirs.discard(directory)
+            _ensure_dir(directory)
+            _write_json(data, file_path, indent)
+        _clear_json_cache(file_path)
         return True
     except Exception as e:
         print(f"Error saving to {file_path}: {e}")
@@ -206,19 +357,21 @@ def save_comparison_file(base_name: str, data: dict[str, Any]) -> bool:
 
 def get_baseline_file_list() -> list[str]:
     """Get list of available baseline files."""
-    if not os.path.exists(BASELINE_DIR):
-        return []
-
     baseline_files = []
-    for file_name in os.listdir(BASELINE_DIR):
-        if (
-            file_name.startswith("baseline_")
-            and file_name.endswith(".json")
-            and file_name != "baseline_energy_summary.json"
-        ):
-            # Extract base name (remove baseline_ prefix and .json suffix)
-            base_name = file_name[9:-5]  # Remove 'baseline_' and '.json'
-            baseline_files.append(base_name)
+    try:
+        with os.scandir(BASELINE_DIR) as entries:
+            for entry in entries:
+                file_name = entry.name
+                if (
+                    file_name.startswith("baseline_")
+                    and file_name.endswith(".json")
+                    and file_name != "baseline_energy_summary.json"
+                ):
+                    # Extract base name (remove baseline_ prefix and .json suffix)
+                    base_name = file_name[9:-5]  # Remove 'baseline_' and '.json'
+                    baseline_files.append(base_name)
+    except FileNotFoundError:
+        return []
 
     return sorted(baseline_files)
 
@@ -272,10 +425,19 @@ def create_file_structure_summary() -> dict[str, Any]:
     }
 
     for dir_name, dir_path in [("baseline", BASELINE_DIR), ("comparison", COMPARISON_DIR)]:
-        if os.path.exists(dir_path):
-            files = [f for f in os.listdir(dir_path) if f.endswith(".json")]
-            total_size = sum(os.path.getsize(os.path.join(dir_path, f)) for f in files)
-
+        # DirEntry carries the file type from the directory read (and its stat on Windows)
+        files = []
+        total_size = 0
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                        files.append(entry.name)
+                        total_size += entry.stat().st_size
+        except FileNotFoundError:
+            summary["directories"][dir_name] = {"path": dir_path, "exists": False}
+            summary["file_counts"][dir_name] = 0
+        else:
             summary["directories"][dir_name] = {
                 "path": dir_path,
                 "files": files,
@@ -284,8 +446,5 @@ def create_file_structure_summary() -> dict[str, Any]:
             }
             summary["file_counts"][dir_name] = len(files)
             summary["total_size_bytes"] += total_size
-        else:
-            summary["directories"][dir_name] = {"path": dir_path, "exists": False}
-            summary["file_counts"][dir_name] = 0
 
     return summary
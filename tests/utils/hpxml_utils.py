@@ -8,14 +8,53 @@ This module provides functions for:
 - Validating HPXML file structure and content
 """
 
+import functools
+import hashlib
 import json
 import os
 import re
 import xml.etree.ElementTree as ET
+from collections import Counter
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from difflib import unified_diff
+from types import MappingProxyType
 from typing import Any
 from typing import Optional
 
+try:
+    from lxml import etree
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# Errors raised for malformed XML by whichever parser is in use
+_PARSE_ERRORS = (ET.ParseError, etree.XMLSyntaxError) if HAS_LXML else (ET.ParseError,)
+
+# Drive-letter and workspace prefixes, normalized together in one scan. Their matches
+# can never overlap, so this is equivalent to substituting them one after another.
+_PATH_PREFIX_RE = re.compile(
+    # Windows-style OpenStudio-HPXML paths: C:/OpenStudio-HPXML/..., including versioned paths.
+    # The separator is only looked ahead at so a workspace path right after it still matches.
+    r"(?P<drive>[A-Z]:/OpenStudio-HPXML[^/]*)(?=/)"
+    # Workspace directory paths: /workspaces/h2k-hpxml/ or /workspaces/h2k_hpxml/
+    r"|/workspaces/h2k[-_]hpxml/"
+)
+
+# Any path ending with OpenStudio-HPXML*/weather/filename (including versioned paths).
+# Applied after the prefixes above, which can change what this pattern spans.
+_WEATHER_PATH_RE = re.compile(r"[^<>]*OpenStudio-HPXML[^/]*/weather/([^<>/]+?)(?:\.epw)?(?=<)")
+
+
+def _prefix_replacement(match: re.Match) -> str:
+    """Return the normalized replacement for a _PATH_PREFIX_RE match."""
+    if match.group("drive") is not None:
+        return "/OpenStudio-HPXML"
+    return "/workspaces/h2k_hpxml/"
+
 
 def normalize_paths_for_comparison(xml_content: str) -> str:
     """
@@ -25,6 +64,14 @@ def normalize_paths_for_comparison(xml_content: str) -> str:
     differences like drive letters (C:/) and mixed path separators, and normalizes
     workspace directory naming differences.
 
+    Weather file paths are reduced to their basename - this is the key fix for
+    cross-environment testing. Examples:
+      /app/deps/OpenStudio-HPXML/weather/CAN_ON_Ottawa.Intl.AP.716280_CWEC2020.epw
+      /home/vscode/.local/share/OpenStudio-HPXML-v1.9.1/weather/CAN_ON_Ottawa.Intl.AP.716280_CWEC2020.epw
+      /workspaces/h2k-hpxml/src/h2k_hpxml/_deps/OpenStudio-HPXML/weather/file.epw
+      C:/OpenStudio-HPXML/weather/file.epw
+    All become: WEATHER_FILE/filename (without .epw extension)
+
     Args:
         xml_content: Raw XML content as string
 
@@ -34,33 +81,211 @@ def normalize_paths_for_comparison(xml_content: str) -> str:
     # First, normalize all backslashes to forward slashes for consistency
     normalized_content = xml_content.replace("\\", "/")
 
-    # Replace Windows-style OpenStudio-HPXML paths with standard format
-    # Pattern matches: C:/OpenStudio-HPXML/... or D:/OpenStudio-HPXML/..., including versioned paths
-    normalized_content = re.sub(
-        r"[A-Z]:/OpenStudio-HPXML[^/]*/", "/OpenStudio-HPXML/", normalized_content
-    )
+    # Drive letters and workspace names in one scan, then weather paths
+    normalized_content = _PATH_PREFIX_RE.sub(_prefix_replacement, normalized_content)
+    return _WEATHER_PATH_RE.sub(r"WEATHER_FILE/\1", normalized_content)
+
+
+_HPXML_TAGS = (
+    "Building",
+    "BuildingDetails",
+    "Site",
+    "SiteType",
+    "BuildingType",
+    "ConditionedFloorArea",
+    "ConditionedBuildingVolume",
+    "NumberofBedrooms",
+    "NumberofBathrooms",
+    "Wall",
+    "Window",
+    "Door",
+    "Floor",
+    "Slab",
+    "Ceiling",
+    "Roof",
+    "HeatingSystem",
+    "CoolingSystem",
+    "HeatPump",
+    "HVACDistribution",
+    "WaterHeatingSystem",
+    "VentilationFan",
+    "Climate",
+    "WeatherStation",
+    "Name",
+    "WMO",
+    "SimulationControl",
+    "Timestep",
+    "Timestamp",
+    "SoftwareInfo",
+    "Version",
+    "Transaction",
+    "CreatedDateAndTime",
+    "XMLTransactionHeaderInformation",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _ns_tags(namespace: str) -> Mapping[str, str]:
+    """Map each HPXML tag name to its namespace-qualified tag, e.g. "{ns}Building"."""
+    return MappingProxyType({tag: f"{namespace}{tag}" for tag in _HPXML_TAGS})
+
+
+@functools.lru_cache(maxsize=8)
+def _ns_paths(namespace: str) -> Mapping[str, str]:
+    """Map each HPXML tag name to a qualified descendant path, e.g. ".//{ns}Building"."""
+    return MappingProxyType({tag: f".//{namespace}{tag}" for tag in _HPXML_TAGS})
+
+
+# Upper bound on entries kept by each per-file cache in this module
+_CACHE_MAX_ENTRIES = 256
+
+
+def _file_cache_key(hpxml_path: str) -> tuple[str, int]:
+    """Key a per-file cache on absolute path and modification time (raises OSError if missing)."""
+    return os.path.abspath(hpxml_path), os.stat(hpxml_path).st_mtime_ns
+
+
+def _lru_get(cache: OrderedDict, key: Any) -> Any:
+    """Return the cached value for key (or None), marking it most recently used."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _lru_put(cache: OrderedDict, key: Any, value: Any) -> None:
+    """Store value under key, evicting the least recently used entry when full."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > _CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+
+def _parse_hpxml(hpxml_path: str) -> tuple[ET.Element, str]:
+    """
+    Parse an HPXML file and detect its namespace.
 
-    # Normalize workspace directory paths that may vary between environments
-    # Pattern matches: /workspaces/h2k-hpxml/ or /workspaces/h2k_hpxml/
-    normalized_content = re.sub(
-        r"/workspaces/h2k[-_]hpxml/", "/workspaces/h2k_hpxml/", normalized_content
-    )
+    Uses lxml's C parser when it is installed, falling back to xml.etree.
 
-    # Normalize weather file paths to just basename - this is the key fix for cross-environment testing
-    # Pattern matches any path ending with OpenStudio-HPXML*/weather/filename (including versioned paths)
-    # Examples:
-    #   /app/deps/OpenStudio-HPXML/weather/CAN_ON_Ottawa.Intl.AP.716280_CWEC2020.epw
-    #   /home/vscode/.local/share/OpenStudio-HPXML-v1.9.1/weather/CAN_ON_Ottawa.Intl.AP.716280_CWEC2020.epw
-    #   /workspaces/h2k-hpxml/src/h2k_hpxml/_deps/OpenStudio-HPXML/weather/file.epw
-    #   C:/OpenStudio-HPXML/weather/file.epw
-    # All become: WEATHER_FILE/filename (without .epw extension)
-    normalized_content = re.sub(
-        r"[^<>]*OpenStudio-HPXML[^/]*/weather/([^<>/]+?)(?:\.epw)?(?=<)",
-        r"WEATHER_FILE/\1",
-        normalized_content,
-    )
+    Args:
+        hpxml_path: Path to HPXML file
 
-    return normalized_content
+    Returns:
+        Tuple of (root element, namespace prefix such as "{http://hpxmlonline.com/2019/10}")
+    """
+    if HAS_LXML:
+        # Drop comments and processing instructions like xml.etree does, so element
+        # counts and normalized output only reflect the HPXML elements themselves
+        parser = etree.XMLParser(remove_comments=True, remove_pis=True, collect_ids=False)
+        root = etree.parse(hpxml_path, parser).getroot()
+    else:
+        root = ET.parse(hpxml_path).getroot()
+
+    # Get namespace if present
+    namespace = ""
+    if root.tag.startswith("{"):
+        namespace = root.tag.split("}")[0] + "}"
+
+    return root, namespace
+
+
+def _text(parent: ET.Element | None, path: str) -> str | None:
+    """Return the text of the first element matching path under parent, or None."""
+    if parent is None:
+        return None
+    elem = parent.find(path)
+    return elem.text if elem is not None else None
+
+
+def _extract_from_root(root: ET.Element, namespace: str, hpxml_path: str) -> dict[str, Any]:
+    """Extract key elements from an already-parsed HPXML tree."""
+    paths = _ns_paths(namespace)
+    tags = _ns_tags(namespace)
+
+    # Extract key building characteristics
+    extracted_data = {
+        "building_info": {},
+        "enclosure": {},
+        "systems": {},
+        "climate": {},
+        "validation": {},
+    }
+
+    # Building info
+    building = root.find(paths["Building"])
+    if building is not None:
+        building_details = building.find(paths["BuildingDetails"])
+        site = building.find(paths["Site"])
+
+        extracted_data["building_info"] = {
+            "site_type": _text(site, paths["SiteType"]),
+            "building_type": _text(building_details, paths["BuildingType"]),
+            "conditioned_floor_area": _text(building_details, paths["ConditionedFloorArea"]),
+            "conditioned_building_volume": _text(
+                building_details, paths["ConditionedBuildingVolume"]
+            ),
+            "number_of_bedrooms": _text(building_details, paths["NumberofBedrooms"]),
+            "number_of_bathrooms": _text(building_details, paths["NumberofBathrooms"]),
+        }
+
+    # Count every element tag in one walk instead of a full-tree findall per tag
+    tag_counts = Counter(elem.tag for elem in root.iter())
+
+    # Enclosure components (walls, windows, doors, etc.)
+    enclosure_elements = ["Wall", "Window", "Door", "Floor", "Slab", "Ceiling", "Roof"]
+    for element in enclosure_elements:
+        count = tag_counts[tags[element]]
+        if count:
+            extracted_data["enclosure"][element.lower() + "s"] = count
+
+    # HVAC Systems
+    hvac_systems = ["HeatingSystem", "CoolingSystem", "HeatPump", "HVACDistribution"]
+    for system in hvac_systems:
+        count = tag_counts[tags[system]]
+        if count:
+            extracted_data["systems"][system.lower() + "s"] = count
+
+    # Hot Water Systems
+    hw_count = tag_counts[tags["WaterHeatingSystem"]]
+    if hw_count:
+        extracted_data["systems"]["water_heating_systems"] = hw_count
+
+    # Ventilation Systems
+    vent_count = tag_counts[tags["VentilationFan"]]
+    if vent_count:
+        extracted_data["systems"]["ventilation_fans"] = vent_count
+
+    # Climate/Weather
+    climate_elem = root.find(paths["Climate"])
+    if climate_elem is not None:
+        weather_station = climate_elem.find(paths["WeatherStation"])
+        extracted_data["climate"] = {
+            "weather_station_name": _text(weather_station, paths["Name"]),
+            "weather_station_wmo": _text(weather_station, paths["WMO"]),
+        }
+
+    # Simulation Control Settings
+    sim_control = root.find(paths["SimulationControl"])
+    if sim_control is not None:
+        extracted_data["simulation_control"] = {
+            "timestep": _text(sim_control, paths["Timestep"]),
+        }
+
+    # Add file validation info
+    extracted_data["validation"] = {
+        "file_size": os.path.getsize(hpxml_path),
+        "root_element": root.tag,
+        "namespace": root.attrib.get("xmlns") if "xmlns" in root.attrib else None,
+        # root.iter() includes the root itself, ".//*" does not
+        "total_elements": tag_counts.total() - 1,
+    }
+
+    return extracted_data
+
+
+# (abspath, mtime_ns) -> extracted key elements / validation results
+_extract_cache: OrderedDict[tuple[str, int], dict[str, Any]] = OrderedDict()
+_validate_cache: OrderedDict[tuple[str, int], dict[str, Any]] = OrderedDict()
 
 
 def extract_hpxml_key_elements(hpxml_path: str) -> dict[str, Any]:
@@ -69,6 +294,8 @@ def extract_hpxml_key_elements(hpxml_path: str) -> dict[str, Any]:
 
     Returns structured data about building characteristics,
     systems, and key parameters that should remain consistent.
+    Successful results are cached on path and modification time and shared
+    between callers, so they must be treated as read-only.
 
     Args:
         hpxml_path: Path to HPXML file
@@ -77,132 +304,56 @@ def extract_hpxml_key_elements(hpxml_path: str) -> dict[str, Any]:
         Dictionary containing extracted key elements
     """
     try:
-        tree = ET.parse(hpxml_path)
-        root = tree.getroot()
-
-        # Get namespace if present
-        namespace = ""
-        if root.tag.startswith("{"):
-            namespace = root.tag.split("}")[0] + "}"
-
-        # Extract key building characteristics
-        extracted_data = {
-            "building_info": {},
-            "enclosure": {},
-            "systems": {},
-            "climate": {},
-            "validation": {},
-        }
-
-        # Building info
-        building = root.find(f".//{namespace}Building")
-        if building is not None:
-            building_details = building.find(f".//{namespace}BuildingDetails")
-            site = building.find(f".//{namespace}Site")
-
-            extracted_data["building_info"] = {
-                "site_type": (
-                    site.find(f".//{namespace}SiteType").text
-                    if site is not None and site.find(f".//{namespace}SiteType") is not None
-                    else None
-                ),
-                "building_type": (
-                    building_details.find(f".//{namespace}BuildingType").text
-                    if building_details is not None
-                    and building_details.find(f".//{namespace}BuildingType") is not None
-                    else None
-                ),
-                "conditioned_floor_area": (
-                    building_details.find(f".//{namespace}ConditionedFloorArea").text
-                    if building_details is not None
-                    and building_details.find(f".//{namespace}ConditionedFloorArea") is not None
-                    else None
-                ),
-                "conditioned_building_volume": (
-                    building_details.find(f".//{namespace}ConditionedBuildingVolume").text
-                    if building_details is not None
-                    and building_details.find(f".//{namespace}ConditionedBuildingVolume")
-                    is not None
-                    else None
-                ),
-                "number_of_bedrooms": (
-                    building_details.find(f".//{namespace}NumberofBedrooms").text
-                    if building_details is not None
-                    and building_details.find(f".//{namespace}NumberofBedrooms") is not None
-                    else None
-                ),
-                "number_of_bathrooms": (
-                    building_details.find(f".//{namespace}NumberofBathrooms").text
-                    if building_details is not None
-                    and building_details.find(f".//{namespace}NumberofBathrooms") is not None
-                    else None
-                ),
-            }
-
-        # Enclosure components (walls, windows, doors, etc.)
-        enclosure_elements = ["Wall", "Window", "Door", "Floor", "Slab", "Ceiling", "Roof"]
-        for element in enclosure_elements:
-            elements = root.findall(f".//{namespace}{element}")
-            if elements:
-                extracted_data["enclosure"][element.lower() + "s"] = len(elements)
-
-        # HVAC Systems
-        hvac_systems = ["HeatingSystem", "CoolingSystem", "HeatPump", "HVACDistribution"]
-        for system in hvac_systems:
-            systems = root.findall(f".//{namespace}{system}")
-            if systems:
-                extracted_data["systems"][system.lower() + "s"] = len(systems)
-
-        # Hot Water Systems
-        hw_systems = root.findall(f".//{namespace}WaterHeatingSystem")
-        if hw_systems:
-            extracted_data["systems"]["water_heating_systems"] = len(hw_systems)
-
-        # Ventilation Systems
-        vent_systems = root.findall(f".//{namespace}VentilationFan")
-        if vent_systems:
-            extracted_data["systems"]["ventilation_fans"] = len(vent_systems)
-
-        # Climate/Weather
-        climate_elem = root.find(f".//{namespace}Climate")
-        if climate_elem is not None:
-            weather_station = climate_elem.find(f".//{namespace}WeatherStation")
-            extracted_data["climate"] = {
-                "weather_station_name": (
-                    weather_station.find(f".//{namespace}Name").text
-                    if weather_station is not None
-                    and weather_station.find(f".//{namespace}Name") is not None
-                    else None
-                ),
-                "weather_station_wmo": (
-                    weather_station.find(f".//{namespace}WMO").text
-                    if weather_station is not None
-                    and weather_station.find(f".//{namespace}WMO") is not None
-                    else None
-                ),
-            }
-
-        # Simulation Control Settings
-        sim_control = root.find(f".//{namespace}SimulationControl")
-        if sim_control is not None:
-            timestep_elem = sim_control.find(f".//{namespace}Timestep")
-            extracted_data["simulation_control"] = {
-                "timestep": timestep_elem.text if timestep_elem is not None else None,
-            }
-
-        # Add file validation info
-        extracted_data["validation"] = {
-            "file_size": os.path.getsize(hpxml_path),
-            "root_element": root.tag,
-            "namespace": root.attrib.get("xmlns") if "xmlns" in root.attrib else None,
-            "total_elements": len(root.findall(".//*")),
-        }
-
-        return extracted_data
+        key = _file_cache_key(hpxml_path)
+        cached = _lru_get(_extract_cache, key)
+        if cached is not None:
+            return cached
 
+        root, namespace = _parse_hpxml(hpxml_path)
+        extracted_data = _extract_from_root(root, namespace, hpxml_path)
     except Exception as e:
         return {"error": f"Failed to parse HPXML: {str(e)}"}
 
+    _lru_put(_extract_cache, key, extracted_data)
+    return extracted_data
+
+
+def _normalize_root(root: ET.Element, namespace: str) -> str:
+    """
+    Normalize an already-parsed HPXML tree for comparison.
+
+    Volatile element text is rewritten in place, so the tree should not be
+    used for extraction afterwards.
+    """
+    paths = _ns_paths(namespace)
+    tags = _ns_tags(namespace)
+
+    # Remove or normalize timestamp elements
+    for timestamp_elem in root.findall(paths["Timestamp"]):
+        timestamp_elem.text = "NORMALIZED_TIMESTAMP"
+
+    # Remove software version info that might change
+    for software_elem in root.findall(paths["SoftwareInfo"]):
+        version_elem = software_elem.find(tags["Version"])
+        if version_elem is not None:
+            version_elem.text = "NORMALIZED_VERSION"
+
+    # Remove transaction elements that contain timestamps
+    for transaction_elem in root.findall(paths["Transaction"]):
+        created_elem = transaction_elem.find(tags["CreatedDateAndTime"])
+        if created_elem is not None:
+            created_elem.text = "NORMALIZED_DATETIME"
+
+    # Sort elements for consistent comparison (if needed)
+    # This depends on HPXML structure and what elements can be reordered
+
+    # Convert to string and normalize paths for cross-platform compatibility
+    if HAS_LXML:
+        xml_content = etree.tostring(root, encoding="unicode")
+    else:
+        xml_content = ET.tostring(root, encoding="unicode")
+    return normalize_paths_for_comparison(xml_content)
+
 
 def normalize_hpxml_for_comparison(hpxml_path: str) -> str:
     """
@@ -216,41 +367,131 @@ def normalize_hpxml_for_comparison(hpxml_path: str) -> str:
         Normalized HPXML content as string
     """
     try:
-        tree = ET.parse(hpxml_path)
-        root = tree.getroot()
-
-        # Get namespace if present
-        namespace = ""
-        if root.tag.startswith("{"):
-            namespace = root.tag.split("}")[0] + "}"
-
-        # Remove or normalize timestamp elements
-        for timestamp_elem in root.findall(f".//{namespace}Timestamp"):
-            timestamp_elem.text = "NORMALIZED_TIMESTAMP"
-
-        # Remove software version info that might change
-        for software_elem in root.findall(f".//{namespace}SoftwareInfo"):
-            version_elem = software_elem.find(f"{namespace}Version")
-            if version_elem is not None:
-                version_elem.text = "NORMALIZED_VERSION"
-
-        # Remove transaction elements that contain timestamps
-        for transaction_elem in root.findall(f".//{namespace}Transaction"):
-            created_elem = transaction_elem.find(f"{namespace}CreatedDateAndTime")
-            if created_elem is not None:
-                created_elem.text = "NORMALIZED_DATETIME"
-
-        # Sort elements for consistent comparison (if needed)
-        # This depends on HPXML structure and what elements can be reordered
-
-        # Convert to string and normalize paths for cross-platform compatibility
-        xml_content = ET.tostring(root, encoding="unicode")
-        normalized_content = normalize_paths_for_comparison(xml_content)
+        root, namespace = _parse_hpxml(hpxml_path)
+        return _normalize_root(root, namespace)
+    except Exception as e:
+        return f"Error normalizing HPXML: {str(e)}"
+
 
-        return normalized_content
+# (abspath, mtime_ns) -> (digest of normalized content, extracted key elements)
+_comparison_cache: OrderedDict[tuple[str, int], tuple[bytes, dict[str, Any]]] = OrderedDict()
 
+
+def _load_for_comparison(hpxml_path: str) -> tuple[str | None, bytes, dict[str, Any]]:
+    """
+    Parse an HPXML file once and return its normalized content, digest and key elements.
+
+    Only the digest and key elements are cached (on path and modification time),
+    so a baseline compared against many candidates is parsed once without keeping
+    its full normalized text in memory. On a cache hit the normalized content is
+    returned as None.
+
+    Raises:
+        ValueError: If the file cannot be parsed or normalized
+    """
+    key = _file_cache_key(hpxml_path)
+    cached = _lru_get(_comparison_cache, key)
+    if cached is not None:
+        return None, cached[0], cached[1]
+
+    try:
+        root, namespace = _parse_hpxml(hpxml_path)
     except Exception as e:
-        return f"Error normalizing HPXML: {str(e)}"
+        raise ValueError(f"Error normalizing HPXML: {str(e)}") from e
+
+    # Extract first: normalization rewrites element text in place. The result also
+    # seeds the extraction cache, so a later byte-identical comparison of this
+    # file needs no parse at all.
+    try:
+        extracted_data = _extract_from_root(root, namespace, hpxml_path)
+        _lru_put(_extract_cache, key, extracted_data)
+    except Exception as e:
+        extracted_data = {"error": f"Failed to parse HPXML: {str(e)}"}
+
+    try:
+        normalized_content = _normalize_root(root, namespace)
+    except Exception as e:
+        raise ValueError(f"Error normalizing HPXML: {str(e)}") from e
+
+    digest = hashlib.blake2b(normalized_content.encode("utf-8"), digest_size=16).digest()
+    _lru_put(_comparison_cache, key, (digest, extracted_data))
+    return normalized_content, digest, extracted_data
+
+
+_DIGEST_CHUNK_SIZE = 1 << 20
+
+# (abspath, mtime_ns, size) -> BLAKE2b digest of the raw file bytes
+_digest_cache: OrderedDict[tuple[str, int, int], bytes] = OrderedDict()
+
+
+def _file_digest(hpxml_path: str, stat_result: os.stat_result) -> bytes:
+    """Return a BLAKE2b digest of a file's bytes, cached on path, mtime and size."""
+    key = (os.path.abspath(hpxml_path), stat_result.st_mtime_ns, stat_result.st_size)
+    digest = _lru_get(_digest_cache, key)
+    if digest is None:
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(hpxml_path, "rb") as f:
+            while chunk := f.read(_DIGEST_CHUNK_SIZE):
+                hasher.update(chunk)
+        digest = hasher.digest()
+        _lru_put(_digest_cache, key, digest)
+    return digest
+
+
+def _files_identical(baseline_path: str, comparison_path: str) -> bool:
+    """Check whether two files have identical bytes, comparing sizes before hashing."""
+    baseline_stat = os.stat(baseline_path)
+    comparison_stat = os.stat(comparison_path)
+    if baseline_stat.st_size != comparison_stat.st_size:
+        return False
+    return _file_digest(baseline_path, baseline_stat) == _file_digest(
+        comparison_path, comparison_stat
+    )
+
+
+def _diff_normalized(baseline_content: str, comparison_content: str) -> list[str]:
+    """
+    Summarize the differences between two normalized HPXML documents.
+
+    Args:
+        baseline_content: Normalized baseline HPXML
+        comparison_content: Normalized comparison HPXML
+
+    Returns:
+        Up to 20 changed lines, followed by a count of any further differences
+    """
+    differences = []
+
+    # Generate detailed differences using unified diff, consuming it lazily so
+    # only the first few differences are materialized
+    diff_lines = unified_diff(
+        baseline_content.splitlines(keepends=True),
+        comparison_content.splitlines(keepends=True),
+        fromfile="baseline",
+        tofile="comparison",
+        lineterm="",
+    )
+
+    # Extract meaningful differences (skip diff headers)
+    # Limit number of differences shown to avoid overwhelming output
+    extra_diffs = 0
+    for line in diff_lines:
+        if line.startswith("---") or line.startswith("+++") or line.startswith("@@"):
+            continue
+        if line.startswith("-") or line.startswith("+"):
+            if len(differences) < 20:
+                differences.append(line.strip())
+            else:
+                extra_diffs += 1
+
+    if extra_diffs:
+        differences.append(f"... and {extra_diffs} more differences")
+
+    # If no meaningful differences found, indicate files differ but in subtle ways
+    if not differences:
+        differences = ["Files differ but differences are subtle (whitespace, formatting, etc.)"]
+
+    return differences
 
 
 def compare_hpxml_files(baseline_path: str, comparison_path: str) -> dict[str, Any]:
@@ -286,61 +527,37 @@ def compare_hpxml_files(baseline_path: str, comparison_path: str) -> dict[str, A
             result["error"] = f"Comparison file not found: {comparison_path}"
             return result
 
-        # Get normalized content for both files
-        baseline_normalized = normalize_hpxml_for_comparison(baseline_path)
-        comparison_normalized = normalize_hpxml_for_comparison(comparison_path)
-
-        # Check for normalization errors
-        if baseline_normalized.startswith("Error normalizing"):
-            result["error"] = baseline_normalized
-            return result
-
-        if comparison_normalized.startswith("Error normalizing"):
-            result["error"] = comparison_normalized
-            return result
-
-        # Check if files are identical after normalization
-        files_match = baseline_normalized == comparison_normalized
+        # Byte-identical files match without any normalization or diffing
+        files_match = False
+        if _files_identical(baseline_path, comparison_path):
+            # One (usually cached) extraction serves both sides
+            baseline_data = extract_hpxml_key_elements(baseline_path)
+            comparison_data = baseline_data
+            # Unparseable files still go through the full path to report the error
+            files_match = "error" not in baseline_data
 
         differences = []
 
         if not files_match:
-            # Generate detailed differences using unified diff
-            diff_lines = list(
-                unified_diff(
-                    baseline_normalized.splitlines(keepends=True),
-                    comparison_normalized.splitlines(keepends=True),
-                    fromfile="baseline",
-                    tofile="comparison",
-                    lineterm="",
-                )
+            # Parse each file once for both normalized content and key elements
+            # (normalization failures raise and are reported as the result error)
+            baseline_normalized, baseline_digest, baseline_data = _load_for_comparison(
+                baseline_path
+            )
+            comparison_normalized, comparison_digest, comparison_data = _load_for_comparison(
+                comparison_path
             )
 
-            # Extract meaningful differences (skip diff headers)
-            meaningful_diffs = []
-            for line in diff_lines:
-                if line.startswith("---") or line.startswith("+++") or line.startswith("@@"):
-                    continue
-                if line.startswith("-") or line.startswith("+"):
-                    meaningful_diffs.append(line.strip())
-
-            # Limit number of differences shown to avoid overwhelming output
-            if len(meaningful_diffs) > 20:
-                differences = meaningful_diffs[:20] + [
-                    f"... and {len(meaningful_diffs) - 20} more differences"
-                ]
-            else:
-                differences = meaningful_diffs
-
-            # If no meaningful differences found, indicate files differ but in subtle ways
-            if not differences:
-                differences = [
-                    "Files differ but differences are subtle (whitespace, formatting, etc.)"
-                ]
+            # Check if files are identical after normalization
+            files_match = baseline_digest == comparison_digest
 
-        # Extract key elements for summary information
-        baseline_data = extract_hpxml_key_elements(baseline_path)
-        comparison_data = extract_hpxml_key_elements(comparison_path)
+            if not files_match:
+                # Only digests are cached, so re-normalize any side that was a cache hit
+                if baseline_normalized is None:
+                    baseline_normalized = normalize_hpxml_for_comparison(baseline_path)
+                if comparison_normalized is None:
+                    comparison_normalized = normalize_hpxml_for_comparison(comparison_path)
+                differences = _diff_normalized(baseline_normalized, comparison_normalized)
 
         result["files_match"] = files_match
         result["differences"] = differences
@@ -360,95 +577,180 @@ def compare_hpxml_files(baseline_path: str, comparison_path: str) -> dict[str, A
     return result
 
 
+def _has_any(root: ET.Element, paths: Mapping[str, str], tags: tuple[str, ...]) -> bool:
+    """Check whether any of tags occurs under root, stopping at the first match."""
+    return any(next(root.iterfind(paths[tag]), None) is not None for tag in tags)
+
+
+def _validate_from_root(
+    root: ET.Element,
+    namespace: str,
+    hpxml_path: str,
+    total_elements: int | None = None,
+) -> dict[str, Any]:
+    """
+    Validate an already-parsed HPXML tree.
+
+    Args:
+        root: Root element of the parsed HPXML file
+        namespace: Namespace prefix detected on the root element
+        hpxml_path: Path to HPXML file (used for the file size)
+        total_elements: Element count if already known, to avoid another full-tree walk
+
+    Returns:
+        Dictionary containing validation results
+    """
+    paths = _ns_paths(namespace)
+    validation_result = {"is_valid": False, "errors": [], "warnings": [], "structure_info": {}}
+
+    # Check for HPXML namespace
+    if "http://hpxmlonline.com" not in str(root.tag):
+        validation_result["warnings"].append("HPXML namespace not found in root element")
+
+    # Check for required top-level elements
+    required_elements = ["XMLTransactionHeaderInformation", "Building"]
+    for element in required_elements:
+        if root.find(paths[element]) is None:
+            validation_result["errors"].append(f"Required element missing: {element}")
+
+    # Check for Building elements
+    building = root.find(paths["Building"])
+    if building is not None:
+        # Check for required Building sub-elements
+        required_building_elements = ["BuildingDetails", "Site"]
+        for element in required_building_elements:
+            if building.find(paths[element]) is None:
+                validation_result["warnings"].append(
+                    f"Recommended Building element missing: {element}"
+                )
+
+    if total_elements is None:
+        # Count without building a list; root.iter() includes the root, ".//*" does not
+        total_elements = sum(1 for _ in root.iter()) - 1
+
+    # Structure information
+    validation_result["structure_info"] = {
+        "root_element": root.tag,
+        "total_elements": total_elements,
+        "file_size_bytes": os.path.getsize(hpxml_path),
+        "has_building": building is not None,
+        "has_climate": root.find(paths["Climate"]) is not None,
+        "has_enclosure": _has_any(root, paths, ("Wall", "Window", "Door")),
+        "has_systems": _has_any(
+            root, paths, ("HeatingSystem", "CoolingSystem", "WaterHeatingSystem")
+        ),
+    }
+
+    # Set validity based on errors
+    validation_result["is_valid"] = len(validation_result["errors"]) == 0
+
+    return validation_result
+
+
+def _validation_error(message: str) -> dict[str, Any]:
+    """Build a failed validation result carrying a single error message."""
+    return {"is_valid": False, "errors": [message], "warnings": [], "structure_info": {}}
+
+
 def validate_hpxml_structure(hpxml_path: str) -> dict[str, Any]:
     """
     Validate HPXML file structure and content.
 
+    Results for files that could be parsed are cached on path and modification
+    time and shared between callers, so they must be treated as read-only.
+
     Args:
         hpxml_path: Path to HPXML file
 
     Returns:
         Dictionary containing validation results
     """
-    validation_result = {"is_valid": False, "errors": [], "warnings": [], "structure_info": {}}
+    try:
+        key = _file_cache_key(hpxml_path)
+        cached = _lru_get(_validate_cache, key)
+        if cached is not None:
+            return cached
+
+        root, namespace = _parse_hpxml(hpxml_path)
+        validation_result = _validate_from_root(root, namespace, hpxml_path)
+    except _PARSE_ERRORS as e:
+        return _validation_error(f"XML parsing error: {str(e)}")
+    except Exception as e:
+        return _validation_error(f"Validation error: {str(e)}")
+
+    _lru_put(_validate_cache, key, validation_result)
+    return validation_result
+
+
+def _analyze_hpxml(hpxml_path: str) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Parse an HPXML file once and return both its key elements and validation results.
+
+    Args:
+        hpxml_path: Path to HPXML file
 
+    Returns:
+        Tuple of (extracted key elements, validation results)
+    """
     try:
-        tree = ET.parse(hpxml_path)
-        root = tree.getroot()
-
-        # Get namespace if present
-        namespace = ""
-        if root.tag.startswith("{"):
-            namespace = root.tag.split("}")[0] + "}"
-
-        # Check for HPXML namespace
-        if "http://hpxmlonline.com" not in str(root.tag):
-            validation_result["warnings"].append("HPXML namespace not found in root element")
-
-        # Check for required top-level elements
-        required_elements = ["XMLTransactionHeaderInformation", "Building"]
-        for element in required_elements:
-            if root.find(f".//{namespace}{element}") is None:
-                validation_result["errors"].append(f"Required element missing: {element}")
-
-        # Check for Building elements
-        building = root.find(f".//{namespace}Building")
-        if building is not None:
-            # Check for required Building sub-elements
-            required_building_elements = ["BuildingDetails", "Site"]
-            for element in required_building_elements:
-                if building.find(f".//{namespace}{element}") is None:
-                    validation_result["warnings"].append(
-                        f"Recommended Building element missing: {element}"
-                    )
-
-        # Structure information
-        validation_result["structure_info"] = {
-            "root_element": root.tag,
-            "total_elements": len(root.findall(".//*")),
-            "file_size_bytes": os.path.getsize(hpxml_path),
-            "has_building": root.find(f".//{namespace}Building") is not None,
-            "has_climate": root.find(f".//{namespace}Climate") is not None,
-            "has_enclosure": any(
-                root.findall(f".//{namespace}{elem}") for elem in ["Wall", "Window", "Door"]
-            ),
-            "has_systems": any(
-                root.findall(f".//{namespace}{elem}")
-                for elem in ["HeatingSystem", "CoolingSystem", "WaterHeatingSystem"]
-            ),
-        }
+        root, namespace = _parse_hpxml(hpxml_path)
+    except _PARSE_ERRORS as e:
+        return (
+            {"error": f"Failed to parse HPXML: {str(e)}"},
+            _validation_error(f"XML parsing error: {str(e)}"),
+        )
+    except Exception as e:
+        return (
+            {"error": f"Failed to parse HPXML: {str(e)}"},
+            _validation_error(f"Validation error: {str(e)}"),
+        )
 
-        # Set validity based on errors
-        validation_result["is_valid"] = len(validation_result["errors"]) == 0
+    total_elements = None
+    try:
+        extracted_data = _extract_from_root(root, namespace, hpxml_path)
+        total_elements = extracted_data["validation"]["total_elements"]
+    except Exception as e:
+        extracted_data = {"error": f"Failed to parse HPXML: {str(e)}"}
 
-    except ET.ParseError as e:
-        validation_result["errors"].append(f"XML parsing error: {str(e)}")
+    try:
+        validation_result = _validate_from_root(root, namespace, hpxml_path, total_elements)
     except Exception as e:
-        validation_result["errors"].append(f"Validation error: {str(e)}")
+        validation_result = _validation_error(f"Validation error: {str(e)}")
 
-    return validation_result
+    return extracted_data, validation_result
+
+
+# File count above which create_hpxml_summary(use_processes=True) switches to processes
+_PROCESS_POOL_THRESHOLD = 32
 
 
-def create_hpxml_summary(hpxml_files: list[str]) -> dict[str, Any]:
+def create_hpxml_summary(hpxml_files: list[str], use_processes: bool = False) -> dict[str, Any]:
     """
     Create a summary of multiple HPXML files.
 
+    Files are analyzed concurrently; results keep the order of hpxml_files.
+
     Args:
         hpxml_files: List of HPXML file paths
+        use_processes: Use a process pool instead of threads for large batches
+            (more than 32 files), for parsers that hold the GIL
 
     Returns:
         Dictionary containing summary information
     """
     summary = {"total_files": len(hpxml_files), "valid_files": 0, "invalid_files": 0, "files": {}}
 
-    for hpxml_file in hpxml_files:
-        base_name = os.path.splitext(os.path.basename(hpxml_file))[0]
-
-        # Extract key elements
-        extracted_data = extract_hpxml_key_elements(hpxml_file)
+    # Extract key elements and validate structure from a single parse per file
+    max_workers = min(8, os.cpu_count() or 4)
+    if use_processes and len(hpxml_files) > _PROCESS_POOL_THRESHOLD:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    with executor:
+        results = list(executor.map(_analyze_hpxml, hpxml_files))
 
-        # Validate structure
-        validation_result = validate_hpxml_structure(hpxml_file)
+    for hpxml_file, (extracted_data, validation_result) in zip(hpxml_files, results, strict=True):
+        base_name = os.path.splitext(os.path.basename(hpxml_file))[0]
 
         summary["files"][base_name] = {
             "file_path": hpxml_file,
@@ -7,43 +7,190 @@ This module provides common functions for:
 - Standardized data extraction methods
 """
 
+import contextlib
+import logging
 import os
 import sqlite3
+from pathlib import Path
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
+# Rows pulled from SQLite per fetchmany() call while building result dicts
+_FETCH_BATCH_SIZE = 256
+
+# Statement cache size for extraction connections; the queries below are kept
+# as module-level constants so repeated extractions reuse compiled statements
+_CACHED_STATEMENTS = 256
+
+# eplusout.sql is finished and never written by these helpers, so map it into
+# memory (256 MiB) with a 64 MiB page cache for the joins against Strings
+_READ_PRAGMAS = (
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Run-period meter totals from the standard EnergyPlus report tables
+_METER_SQL = """
+SELECT rdd.Name, rdd.Units, rdd.KeyValue, SUM(rd.Value) as TotalValue
+FROM ReportDataDictionary rdd
+JOIN ReportData rd ON rdd.ReportDataDictionaryIndex = rd.ReportDataDictionaryIndex
+WHERE rdd.IsMeter = 1
+  AND rdd.ReportingFrequency = 'Run Period'
+  AND rdd.Name NOT LIKE '%Peak%'
+  AND rdd.Name NOT LIKE '%Maximum%'
+  AND rdd.Name NOT LIKE '%Minimum%'
+GROUP BY rdd.Name, rdd.Units, rdd.KeyValue
+HAVING SUM(rd.Value) > 0
+"""
+
+# MATERIALIZED CTE hints need SQLite 3.35+; older versions parse plain CTEs
+_MATERIALIZED = "MATERIALIZED" if sqlite3.sqlite_version_info >= (3, 35, 0) else ""
+
+# Index-based TabularData schema: join with Strings to get the text values.
+# The whitelisted reports and the Peak/Maximum/Minimum columns are resolved to
+# string indexes once in CTEs, so the per-row filters are integer joins rather
+# than string comparisons. Values already stored as numbers come back as REAL;
+# text values are returned as-is for extract_from_tabular_data to parse, since
+# CAST would read a timestamp or range such as '7-15' as its numeric prefix.
+_TABULAR_NEW_SQL = f"""
+WITH valid_reports AS {_MATERIALIZED} (
+    SELECT StringIndex, Value FROM Strings
+    WHERE Value IN (
+        'AnnualBuildingUtilityPerformanceSummary',
+        'EnergyMeters',
+        'Demand End Use Components Summary',
+        'End Use Energy Consumption'
+    )
+),
+excluded_columns AS {_MATERIALIZED} (
+    SELECT StringIndex FROM Strings
+    WHERE Value LIKE '%Peak%'
+       OR Value LIKE '%Maximum%'
+       OR Value LIKE '%Minimum%'
+)
+SELECT
+    vr.Value as ReportName,
+    s2.Value as TableName,
+    s3.Value as RowName,
+    s4.Value as ColumnName,
+    CASE WHEN typeof(td.Value) IN ('real', 'integer') THEN CAST(td.Value AS REAL)
+         ELSE td.Value
+    END as Value,
+    COALESCE(s5.Value, '') as Units
+FROM TabularData td
+JOIN valid_reports vr ON td.ReportNameIndex = vr.StringIndex
+LEFT JOIN excluded_columns ec ON td.ColumnNameIndex = ec.StringIndex
+JOIN Strings s2 ON td.TableNameIndex = s2.StringIndex
+JOIN Strings s3 ON td.RowNameIndex = s3.StringIndex
+JOIN Strings s4 ON td.ColumnNameIndex = s4.StringIndex
+LEFT JOIN Strings s5 ON td.UnitsIndex = s5.StringIndex
+WHERE ec.StringIndex IS NULL
+AND td.Value IS NOT NULL
+AND TRIM(td.Value) != ''
+AND CAST(TRIM(td.Value) AS REAL) > 0
+"""
+
+# Older TabularData schema with the text columns stored directly
+_TABULAR_OLD_SQL = """
+SELECT
+    ReportName,
+    TableName,
+    RowName,
+    ColumnName,
+    CASE WHEN typeof(Value) IN ('real', 'integer') THEN CAST(Value AS REAL)
+         ELSE Value
+    END as Value,
+    COALESCE(Units, '') as Units
+FROM TabularData
+WHERE ReportName IN (
+    'AnnualBuildingUtilityPerformanceSummary',
+    'EnergyMeters',
+    'Demand End Use Components Summary',
+    'End Use Energy Consumption'
+)
+AND ColumnName NOT LIKE '%Peak%'
+AND ColumnName NOT LIKE '%Maximum%'
+AND ColumnName NOT LIKE '%Minimum%'
+AND Value IS NOT NULL
+AND TRIM(Value) != ''
+AND CAST(Value AS REAL) > 0
+"""
+
+
+def _connect_readonly(sql_path: str) -> sqlite3.Connection:
+    """Open an EnergyPlus SQL output read-only and tune it for extraction queries."""
+    # immutable=1 lets SQLite skip file locking; the simulation has already exited
+    uri = f"{Path(sql_path).resolve().as_uri()}?mode=ro&immutable=1"
+    conn = sqlite3.connect(uri, uri=True, cached_statements=_CACHED_STATEMENTS)
+    for pragma in _READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _list_tables(cursor: sqlite3.Cursor) -> list[str]:
+    """Return the names of all tables in the database."""
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
+    return [row[0] for row in cursor.fetchall()]
+
+
+def inspect_sqlite_database(conn_or_path: sqlite3.Connection | str) -> list[str]:
+    """
+    Inspect SQLite database structure for debugging.
+
+    Args:
+        conn_or_path: Open connection to reuse, or path of a database to open
+            read-only for the duration of the inspection
+
+    Returns:
+        List of table names in the database, or an empty list on error
+    """
+    owns_connection = not isinstance(conn_or_path, sqlite3.Connection)
+    conn = None
+    sql_path = conn_or_path if owns_connection else ""
 
-def inspect_sqlite_database(sql_path: str) -> None:
-    """Inspect SQLite database structure for debugging."""
     try:
-        with sqlite3.connect(sql_path) as conn:
-            cursor = conn.cursor()
+        conn = _connect_readonly(conn_or_path) if owns_connection else conn_or_path
+        cursor = conn.cursor()
+
+        # Name the database from the connection itself
+        cursor.execute("PRAGMA database_list")
+        sql_path = cursor.fetchone()[2] or sql_path
 
-            # Get list of tables
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in cursor.fetchall()]
+        # Get list of tables
+        tables = _list_tables(cursor)
 
-            print(f"\n=== Database structure for {os.path.basename(sql_path)} ===")
-            print(f"Available tables: {tables}")
+        print(f"\n=== Database structure for {os.path.basename(sql_path)} ===")
+        print(f"Available tables: {tables}")
 
-            # For each table, show schema and sample data
-            for table in tables[:5]:  # Limit to first 5 tables to avoid clutter
-                try:
-                    cursor.execute(f"PRAGMA table_info({table})")
-                    columns = cursor.fetchall()
-                    print(f"\nTable '{table}' columns:")
-                    for col in columns:
-                        print(f"  {col[1]} ({col[2]})")
+        # For each table, show schema and sample data
+        for table in tables[:5]:  # Limit to first 5 tables to avoid clutter
+            try:
+                cursor.execute(f"PRAGMA table_info({table})")
+                columns = cursor.fetchall()
+                print(f"\nTable '{table}' columns:")
+                for col in columns:
+                    print(f"  {col[1]} ({col[2]})")
 
-                    # Show row count
-                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                    count = cursor.fetchone()[0]
-                    print(f"  Row count: {count}")
+                # Show row count; MAX(rowid) is not usable here because
+                # TabularData declares its own RowId column, which shadows rowid
+                cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                count = cursor.fetchone()[0] or 0
+                print(f"  Row count: {count}")
 
-                except Exception as table_error:
-                    print(f"  Error inspecting table {table}: {table_error}")
+            except Exception as table_error:
+                print(f"  Error inspecting table {table}: {table_error}")
+
+        return tables
 
     except Exception as e:
         print(f"Error inspecting database {sql_path}: {e}")
+        return []
+
+    finally:
+        if owns_connection and conn is not None:
+            conn.close()
 
 
 def extract_from_standard_energyplus(cursor: sqlite3.Cursor) -> dict[str, Any]:
@@ -52,48 +199,31 @@ def extract_from_standard_energyplus(cursor: sqlite3.Cursor) -> dict[str, Any]:
 
     try:
         # Get meter data
-        meter_query = """
-        SELECT rdd.Name, rdd.Units, rdd.KeyValue, SUM(rd.Value) as TotalValue
-        FROM ReportDataDictionary rdd
-        JOIN ReportData rd ON rdd.ReportDataDictionaryIndex = rd.ReportDataDictionaryIndex
-        WHERE rdd.IsMeter = 1
-          AND rdd.ReportingFrequency = 'Run Period'
-          AND rdd.Name NOT LIKE '%Peak%'
-          AND rdd.Name NOT LIKE '%Maximum%'
-          AND rdd.Name NOT LIKE '%Minimum%'
-        GROUP BY rdd.Name, rdd.Units, rdd.KeyValue
-        HAVING SUM(rd.Value) > 0
-        ORDER BY rdd.Name
-        """
-
-        cursor.execute(meter_query)
-        meter_results = cursor.fetchall()
-        print(f"Meter data query found {len(meter_results)} records")
-
-        for row in meter_results:
-            name, units, key_value, total_value = row
-
-            # Use the end-use category as the top-level key
-            category = name.split(":")[0] if ":" in name else name
-            if category not in energy_data:
-                energy_data[category] = {}
-
-            # Use the meter name as the sub-key
-            meter_key = name.split(":", 1)[1] if ":" in name else name
-            energy_data[category][meter_key] = {
-                "value": float(total_value),
-                "units": units,
-                "key_value": key_value,
-            }
+        cursor.execute(_METER_SQL)
+        record_count = 0
+        while rows := cursor.fetchmany(_FETCH_BATCH_SIZE):
+            record_count += len(rows)
+            for name, units, key_value, total_value in rows:
+                # Use the end-use category as the top-level key and the meter
+                # name as the sub-key; names without a colon use the full name
+                category, separator, meter_key = name.partition(":")
+                if not separator:
+                    meter_key = name
+                energy_data.setdefault(category, {})[meter_key] = {
+                    "value": float(total_value),
+                    "units": units,
+                    "key_value": key_value,
+                }
+        logger.debug("Meter data query found %d records", record_count)
 
     except Exception as e:
-        print(f"Error extracting meter data: {e}")
+        logger.warning("Error extracting meter data: %s", e)
 
     # Extract tabular data
     try:
         energy_data.update(extract_from_tabular_data(cursor))
     except Exception as e:
-        print(f"Error extracting tabular data: {e}")
+        logger.warning("Error extracting tabular data: %s", e)
 
     return energy_data
 
@@ -107,88 +237,47 @@ def extract_from_tabular_data(cursor: sqlite3.Cursor) -> dict[str, Any]:
         cursor.execute("PRAGMA table_info(TabularData)")
         columns_info = cursor.fetchall()
         available_columns = [col[1] for col in columns_info]
-        print(f"Available TabularData columns: {available_columns}")
+        logger.debug("Available TabularData columns: %s", available_columns)
 
         if "ReportNameIndex" in available_columns:
             # New format: join with Strings table to get actual text values
-            tabular_query = """
-            SELECT
-                s1.Value as ReportName,
-                s2.Value as TableName,
-                s3.Value as RowName,
-                s4.Value as ColumnName,
-                td.Value,
-                s5.Value as Units
-            FROM TabularData td
-            JOIN Strings s1 ON td.ReportNameIndex = s1.StringIndex
-            JOIN Strings s2 ON td.TableNameIndex = s2.StringIndex
-            JOIN Strings s3 ON td.RowNameIndex = s3.StringIndex
-            JOIN Strings s4 ON td.ColumnNameIndex = s4.StringIndex
-            LEFT JOIN Strings s5 ON td.UnitsIndex = s5.StringIndex
-            WHERE s1.Value IN (
-                'AnnualBuildingUtilityPerformanceSummary',
-                'EnergyMeters',
-                'Demand End Use Components Summary',
-                'End Use Energy Consumption'
-            )
-            AND s4.Value NOT LIKE '%Peak%'
-            AND s4.Value NOT LIKE '%Maximum%'
-            AND s4.Value NOT LIKE '%Minimum%'
-            AND td.Value IS NOT NULL
-            AND TRIM(td.Value) != ''
-            AND CAST(TRIM(td.Value) AS REAL) > 0
-            ORDER BY s1.Value, s2.Value, s3.Value, s4.Value
-            """
+            tabular_query = _TABULAR_NEW_SQL
         else:
             # Old format: direct column access
-            tabular_query = """
-            SELECT ReportName, TableName, RowName, ColumnName, Value, Units
-            FROM TabularData
-            WHERE ReportName IN (
-                'AnnualBuildingUtilityPerformanceSummary',
-                'EnergyMeters',
-                'Demand End Use Components Summary',
-                'End Use Energy Consumption'
-            )
-            AND ColumnName NOT LIKE '%Peak%'
-            AND ColumnName NOT LIKE '%Maximum%'
-            AND ColumnName NOT LIKE '%Minimum%'
-            AND Value IS NOT NULL
-            AND TRIM(Value) != ''
-            AND CAST(Value AS REAL) > 0
-            ORDER BY ReportName, TableName, RowName, ColumnName
-            """
+            tabular_query = _TABULAR_OLD_SQL
 
         cursor.execute(tabular_query)
-        tabular_results = cursor.fetchall()
-        print(f"Tabular data query found {len(tabular_results)} records")
-
-        for row in tabular_results:
-            report_name, table_name, row_name, column_name, value, units = row
-
-            # Build nested structure
-            if report_name not in tabular_data:
-                tabular_data[report_name] = {}
-            if table_name not in tabular_data[report_name]:
-                tabular_data[report_name][table_name] = {}
-            if row_name not in tabular_data[report_name][table_name]:
-                tabular_data[report_name][table_name][row_name] = {}
-
-            # Store the data (clean up value string and convert to float)
-            clean_value = str(value).strip()
-            try:
-                numeric_value = float(clean_value)
-                tabular_data[report_name][table_name][row_name][column_name] = {
-                    "value": numeric_value,
-                    "units": units if units else "",
+        record_count = 0
+        while rows := cursor.fetchmany(_FETCH_BATCH_SIZE):
+            record_count += len(rows)
+            for report_name, table_name, row_name, column_name, value, units in rows:
+                # Numeric storage classes arrive as REAL; text must parse as a float
+                if isinstance(value, str):
+                    try:
+                        value = float(value.strip())
+                    except ValueError:
+                        logger.debug(
+                            "Skipping non-numeric value: '%s' for %s/%s/%s/%s",
+                            value.strip(),
+                            report_name,
+                            table_name,
+                            row_name,
+                            column_name,
+                        )
+                        continue
+
+                # Build nested structure with one lookup per level; SQLite has
+                # already defaulted missing units
+                report = tabular_data.setdefault(report_name, {})
+                table = report.setdefault(table_name, {})
+                table.setdefault(row_name, {})[column_name] = {
+                    "value": value,
+                    "units": units,
                 }
-            except ValueError:
-                print(
-                    f"Skipping non-numeric value: '{clean_value}' for {report_name}/{table_name}/{row_name}/{column_name}"
-                )
+        logger.debug("Tabular data query found %d records", record_count)
 
     except Exception as e:
-        print(f"Error extracting tabular data: {e}")
+        logger.warning("Error extracting tabular data: %s", e)
 
     return tabular_data
 
@@ -201,7 +290,7 @@ def extract_from_hpxml_reports(cursor: sqlite3.Cursor) -> dict[str, Any]:
         # Try to extract from ComponentSummaryReport table
         cursor.execute("SELECT * FROM ComponentSummaryReport LIMIT 5")
         results = cursor.fetchall()
-        print(f"Found {len(results)} records in ComponentSummaryReport")
+        logger.debug("Found %d records in ComponentSummaryReport", len(results))
 
         # This would need to be customized based on actual HPXML report structure
         # For now, return empty structure
@@ -210,7 +299,7 @@ def extract_from_hpxml_reports(cursor: sqlite3.Cursor) -> dict[str, Any]:
         }
 
     except Exception as e:
-        print(f"Error extracting HPXML data: {e}")
+        logger.warning("Error extracting HPXML data: %s", e)
 
     return energy_data
 
@@ -232,12 +321,12 @@ def extract_from_generic_tables(cursor: sqlite3.Cursor, tables: list[str]) -> di
                 }
 
         except Exception as e:
-            print(f"Error sampling table {table}: {e}")
+            logger.warning("Error sampling table %s: %s", table, e)
 
     return energy_data
 
 
-def extract_annual_energy_data(sql_path: str) -> dict[str, Any]:
+def extract_annual_energy_data(sql_path: str, debug: bool = False) -> dict[str, Any]:
     """
     Extract annual energy end-use data from eplusout.sql.
 
@@ -247,61 +336,60 @@ def extract_annual_energy_data(sql_path: str) -> dict[str, Any]:
 
     Args:
         sql_path: Path to the eplusout.sql file
+        debug: Whether to print the database structure before extracting
 
     Returns:
         Dictionary containing extracted energy data
     """
     try:
-        with sqlite3.connect(sql_path) as conn:
+        with contextlib.closing(_connect_readonly(sql_path)) as conn:
             cursor = conn.cursor()
 
-            # First inspect the database to understand its structure
-            inspect_sqlite_database(sql_path)
-
-            # Get available tables
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in cursor.fetchall()]
+            # Get available tables, printing the database structure in debug mode
+            if debug:
+                tables = inspect_sqlite_database(conn)
+            else:
+                tables = _list_tables(cursor)
 
             energy_data = {}
 
             # Different databases have different schemas, try to adapt
             if "ReportDataDictionary" in tables and "ReportData" in tables:
                 # Standard EnergyPlus output format
-                print("\nUsing standard EnergyPlus report format...")
+                logger.debug("Using standard EnergyPlus report format")
                 energy_data = extract_from_standard_energyplus(cursor)
 
             elif "ComponentSummaryReport" in tables:
                 # OpenStudio-HPXML format
-                print("\nUsing OpenStudio-HPXML report format...")
+                logger.debug("Using OpenStudio-HPXML report format")
                 energy_data = extract_from_hpxml_reports(cursor)
 
             else:
                 # Try to find any energy-related data in available tables
-                print(f"\nTrying to extract energy data from available tables: {tables}")
+                logger.debug("Trying to extract energy data from available tables: %s", tables)
                 energy_data = extract_from_generic_tables(cursor, tables)
 
-            print(f"Final energy data structure has {len(energy_data)} categories")
+            logger.debug("Final energy data structure has %d categories", len(energy_data))
             return energy_data
 
     except Exception as e:
-        print(f"Error extracting energy data from {sql_path}: {e}")
+        logger.error("Error extracting energy data from %s: %s", sql_path, e)
         return {}
 
 
 def count_energy_records(energy_data: dict[str, Any]) -> int:
     """Count the total number of energy value records in the data structure."""
     count = 0
+    stack = [energy_data]
 
-    def count_recursive(data):
-        nonlocal count
+    while stack:
+        data = stack.pop()
         if isinstance(data, dict):
             if "value" in data:
                 count += 1
             else:
-                for value in data.values():
-                    count_recursive(value)
+                stack.extend(data.values())
 
-    count_recursive(energy_data)
     return count
 
 
@@ -8,15 +8,25 @@ This module provides common functions for:
 - Finding and verifying output files
 """
 
-import glob
+import contextlib
+import io
 import os
 import platform
-import subprocess
 import sys
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 from typing import Optional
 
+# Located eplusout.sql paths keyed on (base_output_path, base_name); entries are
+# only trusted while the output directory's mtime is unchanged
+_SQL_PATH_CACHE: dict[tuple[str, str], tuple[int, str]] = {}
+
+# H2K example listings keyed on examples directory, as (mtime_ns, files)
+_EXAMPLE_FILES_CACHE: dict[str, tuple[int, list[str]]] = {}
+
 
 def get_python_executable():
     """Get the Python executable path for cross-platform compatibility."""
@@ -49,6 +59,9 @@ def run_h2k_workflow(input_path: str, output_dir: str, debug: bool = True) -> tu
     """
     Run the H2K to HPXML workflow using the CLI tool.
 
+    The h2k-hpxml command is invoked in-process so each run does not pay for
+    a new interpreter and a fresh import of the package.
+
     Args:
         input_path: Path to the H2K input file
         output_dir: Directory for outputs
@@ -57,34 +70,128 @@ def run_h2k_workflow(input_path: str, output_dir: str, debug: bool = True) -> tu
     Returns:
         Tuple of (success, stdout, stderr)
     """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+
     try:
-        # Use the entry point command directly (more reliable than module path)
-        cmd = ["h2k-hpxml", input_path, "--output", output_dir]
+        # Imported here so loading the test utilities doesn't pull in the CLI
+        from h2k_hpxml.cli.convert import cli
+
+        args = [input_path, "--output", output_dir]
 
         if debug:
-            cmd.append("--debug")
+            args.append("--debug")
 
         # Add simulation flag to ensure EnergyPlus runs and creates SQL files
         # Regression tests expect SQL files for energy validation
-        cmd.extend(["--hourly", "ALL"])
-
-        # Set up environment with cross-platform PYTHONPATH
-        env = os.environ.copy()
-        current_pythonpath = env.get("PYTHONPATH", "")
-        new_pythonpath = get_pythonpath()
-        if current_pythonpath:
-            env["PYTHONPATH"] = f"{new_pythonpath}{os.pathsep}{current_pythonpath}"
-        else:
-            env["PYTHONPATH"] = new_pythonpath
+        args.extend(["--hourly", "ALL"])
 
-        # Run the command
-        result = subprocess.run(cmd, capture_output=True, text=True, env=env)
-
-        success = result.returncode == 0
-        return success, result.stdout, result.stderr
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            rv = cli.main(args=args, prog_name="h2k-hpxml", standalone_mode=False)
+        # Without standalone mode, click returns the code of ctx.exit(n) instead of raising
+        success = rv in (None, 0)
 
+    except SystemExit as e:
+        # The CLI exits explicitly on bad input; anything non-zero is a failure
+        success = e.code in (None, 0)
     except Exception as e:
-        return False, "", str(e)
+        stderr.write(str(e))
+        success = False
+
+    return success, stdout.getvalue(), stderr.getvalue()
+
+
+def _find_first(root: str, predicate: Callable[[str], bool]) -> str | None:
+    """
+    Find the first file under root whose name satisfies predicate.
+
+    Files in a directory are checked before descending into its
+    subdirectories, and hidden entries are skipped, so the result matches the
+    first hit of a recursive glob while stopping as soon as it is found.
+
+    Args:
+        root: Directory to search
+        predicate: Called with each file name; returns True for a match
+
+    Returns:
+        Path to the first matching file, or None if there is none
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = [entry for entry in it if not entry.name.startswith(".")]
+    except OSError:
+        return None
+
+    for entry in entries:
+        if predicate(entry.name) and entry.is_file():
+            return entry.path
+
+    for entry in entries:
+        if entry.is_dir():
+            found = _find_first(entry.path, predicate)
+            if found:
+                return found
+
+    return None
+
+
+def run_h2k_workflow_batch(
+    inputs: list[tuple[str, str]], debug: bool = True, max_workers: int | None = None
+) -> list[tuple[bool, str, str]]:
+    """
+    Run the H2K to HPXML workflow for several files in parallel.
+
+    Each input runs in its own worker process with its own output directory,
+    so independent files convert and simulate concurrently.
+
+    Args:
+        inputs: List of (input_path, output_dir) pairs
+        debug: Whether to run in debug mode
+        max_workers: Maximum number of worker processes (defaults to CPU count)
+
+    Returns:
+        List of (success, stdout, stderr) tuples in the same order as inputs
+    """
+    if not inputs:
+        return []
+
+    input_paths = [input_path for input_path, _ in inputs]
+    output_dirs = [output_dir for _, output_dir in inputs]
+    workers = min(len(inputs), max_workers or os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_h2k_workflow, input_paths, output_dirs, repeat(debug)))
+
+
+def _collect_file_names(root: str) -> set[str]:
+    """
+    Collect the names of all files under root.
+
+    Hidden entries are skipped, as in _find_first.
+
+    Args:
+        root: Directory to walk
+
+    Returns:
+        Set of file names (without directories) found anywhere under root
+    """
+    names = set()
+    pending = [root]
+
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        names.add(entry.name)
+        except OSError:
+            continue
+
+    return names
 
 
 def find_sql_file(base_output_path: str, base_name: str) -> str | None:
@@ -106,27 +213,31 @@ def find_sql_file(base_output_path: str, base_name: str) -> str | None:
         os.path.join(base_output_path, "eplusout.sql"),
     ]
 
-    # Also try glob patterns for more flexible searching
-    glob_patterns = [
-        os.path.join(base_output_path, "**", "eplusout.sql"),
-        os.path.join(base_output_path, base_name, "**", "eplusout.sql"),
-    ]
+    # Reuse an earlier result while the output directory is unchanged
+    try:
+        dir_mtime = os.stat(base_output_path).st_mtime_ns
+    except OSError:
+        dir_mtime = None
+    cache_key = (base_output_path, base_name)
+    cached = _SQL_PATH_CACHE.get(cache_key)
+    if cached and cached[0] == dir_mtime and os.path.exists(cached[1]):
+        print(f"Found eplusout.sql at: {cached[1]}")
+        return cached[1]
 
     # Check exact paths first
-    for pattern in search_patterns:
-        if os.path.exists(pattern):
-            print(f"Found eplusout.sql at: {pattern}")
-            return pattern
+    sql_path = next((pattern for pattern in search_patterns if os.path.exists(pattern)), None)
+    if sql_path:
+        print(f"Found eplusout.sql at: {sql_path}")
+    else:
+        # Fall back to a single recursive search that stops at the first match
+        sql_path = _find_first(base_output_path, lambda name: name == "eplusout.sql")
+        if sql_path:
+            print(f"Found eplusout.sql via search at: {sql_path}")
 
-    # Try glob patterns
-    for pattern in glob_patterns:
-        matches = glob.glob(pattern, recursive=True)
-        if matches:
-            sql_path = matches[0]  # Take the first match
-            print(f"Found eplusout.sql via glob at: {sql_path}")
-            return sql_path
+    if sql_path and dir_mtime is not None:
+        _SQL_PATH_CACHE[cache_key] = (dir_mtime, sql_path)
 
-    return None
+    return sql_path
 
 
 def find_hpxml_file(base_output_path: str, base_name: str) -> str | None:
@@ -154,20 +265,11 @@ def find_hpxml_file(base_output_path: str, base_name: str) -> str | None:
             print(f"Found HPXML file at: {pattern}")
             return pattern
 
-    # Try glob patterns for more flexible searching
-    glob_patterns = [
-        os.path.join(base_output_path, "**", "*.xml"),
-        os.path.join(base_output_path, base_name, "**", "*.xml"),
-    ]
-
-    for pattern in glob_patterns:
-        matches = glob.glob(pattern, recursive=True)
-        # Filter to actual HPXML files (exclude other XML files if any)
-        hpxml_matches = [m for m in matches if m.endswith(".xml")]
-        if hpxml_matches:
-            hpxml_path = hpxml_matches[0]  # Take the first match
-            print(f"Found HPXML file via glob at: {hpxml_path}")
-            return hpxml_path
+    # Fall back to a single recursive search that stops at the first match
+    hpxml_path = _find_first(base_output_path, lambda name: name.endswith(".xml"))
+    if hpxml_path:
+        print(f"Found HPXML file via search at: {hpxml_path}")
+        return hpxml_path
 
     return None
 
@@ -192,13 +294,15 @@ def explore_output_directory(output_path: str, max_depth: int = 3) -> dict[str,
 
         try:
             if os.path.isdir(path):
-                for item in os.listdir(path):
-                    item_path = os.path.join(path, item)
-                    if os.path.isdir(item_path):
-                        structure[f"{item}/"] = explore_recursive(item_path, current_depth + 1)
-                    else:
-                        file_size = os.path.getsize(item_path)
-                        structure[item] = f"{file_size} bytes"
+                # DirEntry caches the file type from the directory listing
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            structure[f"{entry.name}/"] = explore_recursive(
+                                entry.path, current_depth + 1
+                            )
+                        else:
+                            structure[entry.name] = f"{entry.stat().st_size} bytes"
             else:
                 return f"file: {os.path.getsize(path)} bytes"
 
@@ -239,10 +343,12 @@ def validate_workflow_outputs(base_output_path: str, base_name: str) -> tuple[bo
     if not hpxml_file:
         missing_files.append("HPXML file (*.xml)")
 
+    # Names of every file in the output tree, collected on first need so a
+    # single walk answers all of the fallback lookups
+    tree_file_names = None
+
     # Search for each expected file
     for expected_file in expected_files:
-        found = False
-
         # Search in common locations
         search_locations = [
             os.path.join(expected_output_path, expected_file),
@@ -250,19 +356,13 @@ def validate_workflow_outputs(base_output_path: str, base_name: str) -> tuple[bo
             os.path.join(expected_output_path, "simulation", expected_file),
         ]
 
-        for location in search_locations:
-            if os.path.exists(location):
-                found = True
-                break
+        if any(os.path.exists(location) for location in search_locations):
+            continue
 
-        # Also try glob search
-        if not found:
-            glob_pattern = os.path.join(expected_output_path, "**", expected_file)
-            matches = glob.glob(glob_pattern, recursive=True)
-            if matches:
-                found = True
-
-        if not found:
+        # Also search the whole output tree
+        if tree_file_names is None:
+            tree_file_names = _collect_file_names(expected_output_path)
+        if expected_file not in tree_file_names:
             missing_files.append(expected_file)
 
     return len(missing_files) == 0, missing_files
@@ -286,16 +386,29 @@ def get_h2k_example_files() -> list[str]:
     ]
 
     for examples_dir in possible_locations:
-        if examples_dir.exists():
+        try:
+            dir_mtime = examples_dir.stat().st_mtime_ns
+        except OSError:
+            continue
+
+        # Adding or removing files updates the directory mtime, so a matching
+        # mtime means the cached listing is still accurate
+        cache_key = str(examples_dir)
+        cached = _EXAMPLE_FILES_CACHE.get(cache_key)
+        if cached and cached[0] == dir_mtime:
+            h2k_files = cached[1]
+        else:
             h2k_files = []
             # Collect both .h2k and .H2K files
             for file_path in examples_dir.glob("*.h2k"):
                 h2k_files.append(str(file_path))
             for file_path in examples_dir.glob("*.H2K"):
                 h2k_files.append(str(file_path))
+            h2k_files.sort()
+            _EXAMPLE_FILES_CACHE[cache_key] = (dir_mtime, h2k_files)
 
-            if h2k_files:
-                return sorted(h2k_files)
+        if h2k_files:
+            return list(h2k_files)
 
     return []
 
@@ -6,10 +6,31 @@ Removes Python cache files, tool caches, and temporary files while preserving
 directory structure. Works on Windows, Linux, and macOS.
 """
 
+import fnmatch
 import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Patterns removed anywhere in the project tree, grouped by cleanup step
+PYTHON_CACHE_PATTERNS = ("__pycache__", "*.pyc", "*.pyo")
+CACHE_DIR_PATTERNS = ("*.egg-info",)
+TEMP_FILE_PATTERNS = (
+    "test_results_*.txt",
+    "*.tmp",
+    "*.temp",
+    "*.bak",
+    ".DS_Store",  # macOS
+    "Thumbs.db",  # Windows
+    "desktop.ini",  # Windows
+)
+TEMP_DIR_PATTERNS = ("tmp*", "temp*", "tests/temp", "tests/tmp*")
+
+# Version control and environment directories are never searched; they hold
+# no project caches, and packages inside them can match names like "temp*"
+EXCLUDED_DIRS = frozenset({".git", ".venv", "venv", "node_modules", ".tox"})
+
 
 def remove_tree_if_exists(path):
     """Remove directory tree if it exists, ignore errors."""
@@ -34,25 +55,120 @@ def remove_file_if_exists(path):
     return False
 
 
+def collect_pattern_matches(root_path, patterns):
+    """
+    Find entries under root_path matching each pattern in a single walk.
+
+    Each pattern behaves like Path(root_path).rglob(pattern), but the tree is
+    read once with os.scandir for all patterns, and entry types come from the
+    directory listing rather than a stat per path. Symlinked directories and
+    EXCLUDED_DIRS are not descended into.
+
+    Returns:
+        Dict mapping each pattern to a list of matching os.DirEntry objects
+    """
+    # Match each pattern component with its own regex; case-insensitive on
+    # Windows like pathlib
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    compiled = [
+        (pattern, [re.compile(fnmatch.translate(part), flags).match for part in pattern.split("/")])
+        for pattern in patterns
+    ]
+    # Only as many trailing path components as the longest pattern are needed
+    keep = max((len(matchers) for _, matchers in compiled), default=1) - 1
+    matches = {pattern: [] for pattern in patterns}
+
+    pending = [(root_path, ())]
+    while pending:
+        directory, parents = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                entries = list(entries)
+        except OSError:
+            continue
+
+        for entry in entries:
+            if entry.name in EXCLUDED_DIRS:
+                continue
+            parts = (*parents, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                pending.append((entry.path, parts[len(parts) - keep :] if keep else ()))
+            for pattern, matchers in compiled:
+                depth = len(matchers)
+                if len(parts) >= depth and all(
+                    match(part) for match, part in zip(matchers, parts[-depth:], strict=True)
+                ):
+                    matches[pattern].append(entry)
+
+    return matches
+
+
+def _remove_tree(path):
+    """Remove a directory tree, returning whether it was removed."""
+    try:
+        shutil.rmtree(path)
+        return True
+    except (OSError, PermissionError):
+        # Ignore permission errors and trees already removed, continue cleanup
+        return False
+
+
+def _top_level_dirs(entries):
+    """
+    Return paths of directory entries that are not inside another entry.
+
+    Matches are listed before anything found inside them, so removing only
+    the outermost directories removes the same files as removing every
+    entry in order.
+    """
+    selected = set()
+    paths = []
+    for entry in entries:
+        if not entry.is_dir():
+            continue
+        parent = os.path.dirname(entry.path)
+        while parent and parent not in selected and os.path.dirname(parent) != parent:
+            parent = os.path.dirname(parent)
+        if parent not in selected:
+            selected.add(entry.path)
+            paths.append(entry.path)
+    return paths
+
+
+def remove_entries(entries, file_type="file"):
+    """Remove the given files or directories, returning how many were removed."""
+    if file_type == "dir":
+        # Tree removal is dominated by unlink/rmdir syscalls, which release
+        # the GIL, so independent trees are removed concurrently
+        paths = _top_level_dirs(entries)
+        if len(paths) <= 1:
+            return sum(map(_remove_tree, paths))
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            return sum(executor.map(_remove_tree, paths))
+
+    removed_count = 0
+    for entry in entries:
+        try:
+            if file_type == "file" and entry.is_file():
+                os.unlink(entry.path)
+                removed_count += 1
+        except (OSError, PermissionError):
+            # Ignore permission errors and files already removed with a
+            # parent directory, continue cleanup
+            pass
+
+    return removed_count
+
+
 def find_and_remove_pattern(root_path, pattern, file_type="file"):
     """Find and remove files or directories matching pattern."""
-    removed_count = 0
     try:
-        for path in Path(root_path).rglob(pattern):
-            try:
-                if file_type == "file" and path.is_file():
-                    path.unlink()
-                    removed_count += 1
-                elif file_type == "dir" and path.is_dir():
-                    shutil.rmtree(path)
-                    removed_count += 1
-            except (OSError, PermissionError):
-                # Ignore permission errors, continue cleanup
-                pass
+        entries = collect_pattern_matches(root_path, [pattern])[pattern]
     except Exception as e:
         print(f"  Warning: Error searching for {pattern}: {e}")
+        return 0
 
-    return removed_count
+    return remove_entries(entries, file_type)
 
 
 def clean_output_directory():
@@ -96,11 +212,17 @@ def main():
 
     cleanup_count = 0
 
+    # Walk the project once for every pattern used below; entries that go
+    # away with an earlier removal are skipped when their turn comes
+    matches = collect_pattern_matches(
+        ".", [*PYTHON_CACHE_PATTERNS, *CACHE_DIR_PATTERNS, *TEMP_FILE_PATTERNS, *TEMP_DIR_PATTERNS]
+    )
+
     # 1. Remove Python cache files
     print("\nRemoving Python cache files...")
-    pycache_count = find_and_remove_pattern(".", "__pycache__", "dir")
-    pyc_count = find_and_remove_pattern(".", "*.pyc", "file")
-    pyo_count = find_and_remove_pattern(".", "*.pyo", "file")
+    pycache_count = remove_entries(matches["__pycache__"], "dir")
+    pyc_count = remove_entries(matches["*.pyc"], "file")
+    pyo_count = remove_entries(matches["*.pyo"], "file")
 
     if pycache_count or pyc_count or pyo_count:
         print(
@@ -118,14 +240,14 @@ def main():
         ".coverage",
         "build",
         "dist",
-        "*.egg-info",
+        *CACHE_DIR_PATTERNS,
     ]
 
     cache_removed = 0
     for cache_dir in cache_dirs:
         if "*" in cache_dir:
             # Handle glob patterns
-            cache_removed += find_and_remove_pattern(".", cache_dir, "dir")
+            cache_removed += remove_entries(matches[cache_dir], "dir")
         else:
             if remove_tree_if_exists(cache_dir):
                 cache_removed += 1
@@ -143,19 +265,9 @@ def main():
 
     # 4. Remove test result files
     print("\nRemoving temporary files...")
-    temp_patterns = [
-        "test_results_*.txt",
-        "*.tmp",
-        "*.temp",
-        "*.bak",
-        ".DS_Store",  # macOS
-        "Thumbs.db",  # Windows
-        "desktop.ini",  # Windows
-    ]
-
     temp_removed = 0
-    for pattern in temp_patterns:
-        temp_removed += find_and_remove_pattern(".", pattern, "file")
+    for pattern in TEMP_FILE_PATTERNS:
+        temp_removed += remove_entries(matches[pattern], "file")
 
     if temp_removed:
         print(f"  Removed {temp_removed} temporary files")
@@ -163,11 +275,9 @@ def main():
 
     # 5. Clean up any temporary test directories
     print("\nRemoving temporary test directories...")
-    temp_dir_patterns = ["tmp*", "temp*", "tests/temp", "tests/tmp*"]
-
     temp_dirs_removed = 0
-    for pattern in temp_dir_patterns:
-        temp_dirs_removed += find_and_remove_pattern(".", pattern, "dir")
+    for pattern in TEMP_DIR_PATTERNS:
+        temp_dirs_removed += remove_entries(matches[pattern], "dir")
 
     if temp_dirs_removed:
         print(f"  Removed {temp_dirs_removed} temporary directories")
@@ -18,24 +18,30 @@ Examples:
 """
 
 import argparse
+import os
 import re
 import subprocess
 import sys
 from pathlib import Path
 
 
-def run_command(cmd, check=True, capture_output=False):
+def run_command(cmd, check=True, capture_output=False, env=None):
     """Run a shell command and return the result."""
     print(f"🔧 Running: {' '.join(cmd) if isinstance(cmd, list) else cmd}")
 
     try:
         if capture_output:
             result = subprocess.run(
-                cmd, shell=isinstance(cmd, str), check=check, capture_output=True, text=True
+                cmd,
+                shell=isinstance(cmd, str),
+                check=check,
+                capture_output=True,
+                text=True,
+                env=env,
             )
             return result.stdout.strip()
         else:
-            subprocess.run(cmd, shell=isinstance(cmd, str), check=check)
+            subprocess.run(cmd, shell=isinstance(cmd, str), check=check, env=env)
             return None
     except subprocess.CalledProcessError as e:
         print(f"❌ Command failed: {e}")
@@ -46,6 +52,24 @@ def run_command(cmd, check=True, capture_output=False):
         sys.exit(1)
 
 
+def run_commands_concurrently(cmds):
+    """Run independent commands in parallel and exit if any of them fails."""
+    processes = []
+    for cmd in cmds:
+        print(f"🔧 Running: {' '.join(cmd)}")
+        processes.append((cmd, subprocess.Popen(cmd)))
+
+    failed = False
+    for cmd, process in processes:
+        returncode = process.wait()
+        if returncode != 0:
+            print(f"❌ Command failed: {' '.join(cmd)} returned non-zero exit status {returncode}")
+            failed = True
+
+    if failed:
+        sys.exit(1)
+
+
 def get_git_branch():
     """Get the current Git branch name and sanitize it for Docker tag."""
     try:
@@ -53,6 +77,11 @@ def get_git_branch():
         # Sanitize branch name for Docker tag (replace invalid characters with hyphens)
         sanitized = re.sub(r"[^a-zA-Z0-9._-]", "-", branch)
         return sanitized
+    except FileNotFoundError:
+        # Reading the branch doubles as the Git availability check
+        print("❌ Git is not available")
+        print("   Please install Git")
+        sys.exit(1)
     except Exception:
         print("❌ Failed to get Git branch. Are you in a Git repository?")
         sys.exit(1)
@@ -69,17 +98,6 @@ def check_docker():
         sys.exit(1)
 
 
-def check_git():
-    """Check if Git is available."""
-    try:
-        run_command(["git", "--version"], capture_output=True)
-        print("✅ Git is available")
-    except Exception:
-        print("❌ Git is not available")
-        print("   Please install Git")
-        sys.exit(1)
-
-
 def find_dockerfile():
     """Find the Dockerfile in the current directory or parent directories."""
     current_dir = Path.cwd()
@@ -127,10 +145,6 @@ def main():
     print("🐳 H2K-HPXML Docker Build and Push Script")
     print("=" * 50)
 
-    # Check prerequisites
-    check_docker()
-    check_git()
-
     # Get branch and dockerfile
     branch = get_git_branch()
     dockerfile_path = Path(args.dockerfile) if args.dockerfile else find_dockerfile()
@@ -150,33 +164,45 @@ def main():
 
     if args.dry_run:
         print("\n🔍 DRY RUN MODE - Commands that would be executed:")
-        print(f"   docker build -t {primary_tag} -f {dockerfile_path} {dockerfile_path.parent}")
+        print(
+            f"   DOCKER_BUILDKIT=1 docker build -t {primary_tag} --cache-from {primary_tag}"
+            f" --build-arg BUILDKIT_INLINE_CACHE=1 -f {dockerfile_path} {dockerfile_path.parent}"
+        )
         for tag in tags:
             print(f"   docker push {tag}")
         return
 
-    # Build the image
+    # Docker is only needed once something is actually built
+    check_docker()
+
+    # Build the image with BuildKit, reusing layers from the last pushed image
+    # for this branch; the inline cache metadata makes the pushed image usable
+    # as a cache source for the next build
     print("\n🔨 Building Docker image...")
     build_cmd = [
         "docker",
         "build",
         "-t",
         primary_tag,
+        "--cache-from",
+        primary_tag,
+        "--build-arg",
+        "BUILDKIT_INLINE_CACHE=1",
         "-f",
         str(dockerfile_path),
         str(dockerfile_path.parent),
     ]
-    run_command(build_cmd)
+    run_command(build_cmd, env={**os.environ, "DOCKER_BUILDKIT": "1"})
 
     # Tag additional tags
     for tag in tags[1:]:  # Skip the first tag as it's already applied
         print(f"🏷️  Adding tag: {tag}")
         run_command(["docker", "tag", primary_tag, tag])
 
-    # Push all tags
-    for tag in tags:
-        print(f"📤 Pushing {tag}...")
-        run_command(["docker", "push", tag])
+    # Push all tags; each push is independent once the image is built, so the
+    # uploads run side by side
+    print(f"📤 Pushing {', '.join(tags)}...")
+    run_commands_concurrently([["docker", "push", tag] for tag in tags])
 
     print("\n✅ Successfully built and pushed:")
     for tag in tags: